@@ -1,2 +1,2 @@
-# package marker
-
+# package marker
+
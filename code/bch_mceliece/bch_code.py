@@ -1,233 +1,249 @@
-import random
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
-
-from code.gf2 import (
-    BitVector,
-    Matrix,
-    apply_permutation,
-    apply_permutation_matrix,
-    mat_inv,
-    mat_mul,
-    mat_vec_mul,
-    pack_bits,
-    random_invertible_matrix,
-    random_permutation,
-)
-
-# (15,7) BCH, t=2, g(x)=x^8 + x^7 + x^6 + x^4 + 1
-N = 15
-K = 7
-T = 2
-G_POLY = (1 << 8) | (1 << 7) | (1 << 6) | (1 << 4) | 1
-
-
-def poly_degree(p: int) -> int:
-    return p.bit_length() - 1 if p else -1
-
-
-def poly_mul(a: int, b: int) -> int:
-    res = 0
-    while b:
-        if b & 1:
-            res ^= a
-        a <<= 1
-        b >>= 1
-    return res
-
-
-def poly_divmod(dividend: int, divisor: int) -> Tuple[int, int]:
-    if divisor == 0:
-        raise ZeroDivisionError
-    ddeg = poly_degree(divisor)
-    rem = dividend
-    quot = 0
-    while poly_degree(rem) >= ddeg:
-        shift = poly_degree(rem) - ddeg
-        quot ^= 1 << shift
-        rem ^= divisor << shift
-    return quot, rem
-
-
-def compute_h_poly() -> int:
-    x15_minus_1 = (1 << 15) | 1
-    quot, rem = poly_divmod(x15_minus_1, G_POLY)
-    assert rem == 0
-    return quot
-
-
-H_POLY = compute_h_poly()
-
-
-def poly_to_bits(p: int, length: int) -> BitVector:
-    return [(p >> i) & 1 for i in range(length)]
-
-
-def encode_block(msg7: BitVector) -> BitVector:
-    if len(msg7) != K:
-        raise ValueError("消息块必须 7 比特")
-    m = 0
-    for i, b in enumerate(msg7):
-        if b:
-            m |= 1 << i
-    code_poly = poly_mul(m, G_POLY)
-    return poly_to_bits(code_poly, N)
-
-
-def compute_syndrome_vec(vec: BitVector) -> int:
-    poly = 0
-    for i, b in enumerate(vec):
-        if b:
-            poly |= 1 << i
-    _, rem = poly_divmod(poly, G_POLY)
-    return rem
-
-
-def syndrome_table(t: int) -> Dict[int, BitVector]:
-    table: Dict[int, BitVector] = {0: [0] * N}
-    for i in range(N):
-        e = [0] * N
-        e[i] = 1
-        table.setdefault(compute_syndrome_vec(e), e)
-    if t >= 2:
-        for i in range(N):
-            for j in range(i + 1, N):
-                e = [0] * N
-                e[i] = e[j] = 1
-                table.setdefault(compute_syndrome_vec(e), e)
-    return table
-
-
-def parity_check_matrix() -> Matrix:
-    rows: Matrix = []
-    h = H_POLY
-    for shift in range(N - K):
-        poly = (h << shift) & ((1 << N) - 1)
-        overflow = poly >> N
-        poly = (poly & ((1 << N) - 1)) ^ overflow
-        rows.append(poly_to_bits(poly, N))
-    return rows
-
-
-def decode_block(r: BitVector, synd_table: Dict[int, BitVector]) -> Tuple[BitVector, bool]:
-    if len(r) != N:
-        raise ValueError("码长必须 15 比特")
-    syn = compute_syndrome_vec(r)
-    if syn not in synd_table:
-        return r[:K], False
-    e = synd_table[syn]
-    c = [r[i] ^ e[i] for i in range(N)]
-    c_poly = 0
-    for i, b in enumerate(c):
-        if b:
-            c_poly |= 1 << i
-    msg, rem = poly_divmod(c_poly, G_POLY)
-    return poly_to_bits(msg, K), rem == 0
-
-
-def base_generator() -> Matrix:
-    rows: Matrix = []
-    for i in range(K):
-        msg = [1 if j == i else 0 for j in range(K)]
-        rows.append(encode_block(msg))
-    return rows
-
-
-def block_generator(L: int) -> Matrix:
-    base = base_generator()
-    k, n = K * L, N * L
-    G = [[0] * n for _ in range(k)]
-    for blk in range(L):
-        for r in range(K):
-            row_idx = blk * K + r
-            for c, v in enumerate(base[r]):
-                G[row_idx][blk * N + c] = v
-    return G
-
-
-@dataclass
-class PublicKey:
-    G_pub: Matrix
-    n: int
-    k: int
-    L: int
-    errors_per_block: int
-    P: List[int]
-
-    def serialize_size(self) -> int:
-        size_G = len(pack_bits([b for row in self.G_pub for b in row]))
-        size_P = len(self.P) * 2
-        return size_G + size_P
-
-
-@dataclass
-class PrivateKey:
-    S_inv: Matrix
-    P_inv: List[int]
-    synd_table: Dict[int, BitVector]
-    L: int
-    errors_per_block: int
-
-    def serialize_size(self) -> int:
-        size_S = len(pack_bits([b for row in self.S_inv for b in row]))
-        size_P = len(self.P_inv) * 2
-        size_table = sum(2 + len(pack_bits(v)) for v in self.synd_table.values())
-        return size_S + size_P + size_table
-
-
-class BCHMcEliece:
-    def __init__(self, L: int, errors_per_block: int = T, rng=random):
-        if errors_per_block > T:
-            raise ValueError("BCH(15,7) 最多纠正 2 比特")
-        self.L = L
-        self.errors_per_block = errors_per_block
-        self.n = N * L
-        self.k = K * L
-        self.rng = rng
-        self._G = block_generator(L)
-        self._synd_table = syndrome_table(errors_per_block)
-
-    def keygen(self) -> Tuple[PublicKey, PrivateKey]:
-        S = random_invertible_matrix(self.k)
-        S_inv = mat_inv(S)
-        P = random_permutation(self.n)
-        P_inv = [0] * self.n
-        for i, p in enumerate(P):
-            P_inv[p] = i
-        G_pub = apply_permutation_matrix(mat_mul(S, self._G), P)
-        return (
-            PublicKey(G_pub, self.n, self.k, self.L, self.errors_per_block, P),
-            PrivateKey(S_inv, P_inv, self._synd_table, self.L, self.errors_per_block),
-        )
-
-    def _sample_error_private(self) -> BitVector:
-        e = [0] * self.n
-        for blk in range(self.L):
-            positions = list(range(blk * N, (blk + 1) * N))
-            self.rng.shuffle(positions)
-            for pos in positions[: self.errors_per_block]:
-                e[pos] = 1
-        return e
-
-    def encrypt(self, m_bits: BitVector, pub: PublicKey) -> BitVector:
-        if len(m_bits) != pub.k:
-            raise ValueError(f"明文长度必须 {pub.k}")
-        u = mat_vec_mul(m_bits, pub.G_pub)
-        e_private = self._sample_error_private()
-        e_public = apply_permutation(e_private, pub.P)
-        return [(u[i] ^ e_public[i]) for i in range(pub.n)]
-
-    def decrypt(self, c_bits: BitVector, pub: PublicKey, priv: PrivateKey) -> Tuple[BitVector, bool]:
-        if len(c_bits) != pub.n:
-            raise ValueError(f"密文长度必须 {pub.n}")
-        c_perm = apply_permutation(c_bits, priv.P_inv)
-        decoded: BitVector = []
-        success = True
-        for blk in range(pub.L):
-            block = c_perm[blk * N : (blk + 1) * N]
-            msg, ok = decode_block(block, priv.synd_table)
-            decoded.extend(msg)
-            success = success and ok
-        m = mat_vec_mul(decoded, priv.S_inv)
-        return m, success
-
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from code.gf2 import (
+    BitVector,
+    Matrix,
+    apply_permutation_matrix,
+    bits_to_int,
+    int_to_bits,
+    inverse_permutation,
+    mat_from_bits,
+    mat_inv,
+    mat_mul,
+    m4r_tables,
+    random_invertible_matrix,
+    random_permutation,
+)
+
+# (15,7) BCH, t=2, g(x)=x^8 + x^7 + x^6 + x^4 + 1
+N = 15
+K = 7
+T = 2
+G_POLY = (1 << 8) | (1 << 7) | (1 << 6) | (1 << 4) | 1
+
+
+def poly_degree(p: int) -> int:
+    return p.bit_length() - 1 if p else -1
+
+
+def poly_divmod(dividend: int, divisor: int) -> Tuple[int, int]:
+    if divisor == 0:
+        raise ZeroDivisionError
+    ddeg = poly_degree(divisor)
+    rem = dividend
+    quot = 0
+    while poly_degree(rem) >= ddeg:
+        shift = poly_degree(rem) - ddeg
+        quot ^= 1 << shift
+        rem ^= divisor << shift
+    return quot, rem
+
+
+def poly_to_bits(p: int, length: int) -> BitVector:
+    return [(p >> i) & 1 for i in range(length)]
+
+
+# CRC 风格按字节约简表：RED[b] = (b << 8) mod g(x)，配合低 8 位即可约简任意 15 位输入
+RED = [poly_divmod(b << 8, G_POLY)[1] for b in range(1 << (N - 8))]
+
+
+def poly_mod_g(poly: int) -> int:
+    return RED[poly >> 8] ^ (poly & 0xFF)
+
+
+def encode_int(m_int: int) -> int:
+    # 系统码：c(x) = m(x)·x^8 + (m(x)·x^8 mod g)，消息位即码字高 7 位
+    shifted = m_int << (N - K)
+    return shifted ^ poly_mod_g(shifted)
+
+
+def encode_block(msg7: BitVector) -> BitVector:
+    if len(msg7) != K:
+        raise ValueError("消息块必须 7 比特")
+    return poly_to_bits(encode_int(bits_to_int(msg7)), N)
+
+
+def compute_syndrome_vec(vec: BitVector) -> int:
+    poly = 0
+    for i, b in enumerate(vec):
+        if b:
+            poly |= 1 << i
+    return poly_mod_g(poly)
+
+
+def syndrome_table(t: int) -> Dict[int, BitVector]:
+    # 单比特错误综合征只需算一次；双比特综合征由线性性质 s(e_i^e_j)=s_i^s_j 得出
+    singles = []
+    for i in range(N):
+        e = [0] * N
+        e[i] = 1
+        singles.append(compute_syndrome_vec(e))
+    table: Dict[int, BitVector] = {0: [0] * N}
+    for i in range(N):
+        e = [0] * N
+        e[i] = 1
+        table.setdefault(singles[i], e)
+    if t >= 2:
+        for i in range(N):
+            for j in range(i + 1, N):
+                e = [0] * N
+                e[i] = e[j] = 1
+                table.setdefault(singles[i] ^ singles[j], e)
+    return table
+
+
+def syndrome_array(t: int) -> List[Optional[int]]:
+    """长度 2^(N-K) 的平坦表：综合征 -> 错误模式整数；无对应项为 None"""
+    arr: List[Optional[int]] = [None] * (1 << (N - K))
+    for syn, e in syndrome_table(t).items():
+        arr[syn] = bits_to_int(e)
+    return arr
+
+
+def decode_block_int(r_int: int, synd_arr: List[Optional[int]]) -> Tuple[int, bool]:
+    syn = poly_mod_g(r_int)
+    e_int = synd_arr[syn]
+    if e_int is None:
+        return r_int >> (N - K), False
+    # 纠错后码字必然整除 g，消息就是高 7 位，无需再做除法
+    return (r_int ^ e_int) >> (N - K), True
+
+
+def decode_block(r: BitVector, synd_arr: List[Optional[int]]) -> Tuple[BitVector, bool]:
+    if len(r) != N:
+        raise ValueError("码长必须 15 比特")
+    msg, ok = decode_block_int(bits_to_int(r), synd_arr)
+    return poly_to_bits(msg, K), ok
+
+
+@lru_cache(maxsize=1)
+def base_generator() -> Matrix:
+    rows: Matrix = []
+    for i in range(K):
+        msg = [1 if j == i else 0 for j in range(K)]
+        rows.append(encode_block(msg))
+    return rows
+
+
+@lru_cache(maxsize=None)
+def block_generator(L: int) -> Matrix:
+    # I_L 与单块生成矩阵的 Kronecker 积：整行由列表拼接一次构造
+    base = base_generator()
+    zeros = [0] * N
+    return [
+        zeros * blk + row + zeros * (L - blk - 1)
+        for blk in range(L)
+        for row in base
+    ]
+
+
+@dataclass
+class PublicKey:
+    G_pub_rows: List[int]  # 行打包的公开生成矩阵（第 j 列对应第 j 位）
+    n: int
+    k: int
+    L: int
+    errors_per_block: int
+    P: List[int]
+    P_inv: List[int]  # 由 P 导出，加密时定位错误比特的公开域位置
+    G_pub_m4r: List[List[int]]  # 由 G_pub 导出的 M4R 查找表，不计入密钥尺寸
+
+    def serialize_size(self) -> int:
+        size_G = (self.k * self.n + 7) // 8
+        size_P = len(self.P) * 2
+        return size_G + size_P
+
+
+@dataclass
+class PrivateKey:
+    S_inv_rows: List[int]  # 行打包的 S^{-1}，解密时按位异或累加
+    P_inv: List[int]
+    synd_table: List[Optional[int]]
+    L: int
+    errors_per_block: int
+
+    def serialize_size(self) -> int:
+        k = len(self.S_inv_rows)
+        size_S = (k * k + 7) // 8
+        size_P = len(self.P_inv) * 2
+        size_table = 2 * len(self.synd_table)  # 每项一个 15 位错误模式
+        return size_S + size_P + size_table
+
+
+class BCHMcEliece:
+    def __init__(self, L: int, errors_per_block: int = T, rng=random):
+        if errors_per_block > T:
+            raise ValueError("BCH(15,7) 最多纠正 2 比特")
+        self.L = L
+        self.errors_per_block = errors_per_block
+        self.n = N * L
+        self.k = K * L
+        self.rng = rng
+        self._G = block_generator(L)
+        self._synd_table = syndrome_array(errors_per_block)
+
+    def keygen(self) -> Tuple[PublicKey, PrivateKey]:
+        S = random_invertible_matrix(self.k, self.rng)
+        S_inv = mat_inv(S)
+        P = random_permutation(self.n, self.rng)
+        P_inv = inverse_permutation(P)
+        G_pub = apply_permutation_matrix(mat_mul(S, self._G), P)
+        G_pub_rows = mat_from_bits(G_pub)
+        return (
+            PublicKey(
+                G_pub_rows, self.n, self.k, self.L, self.errors_per_block,
+                P, P_inv, m4r_tables(G_pub_rows),
+            ),
+            PrivateKey(mat_from_bits(S_inv), P_inv, self._synd_table, self.L, self.errors_per_block),
+        )
+
+    def _error_positions(self) -> List[int]:
+        """每块注入 errors_per_block 个错误，返回私有域下标"""
+        return [
+            blk * N + pos
+            for blk in range(self.L)
+            for pos in self.rng.sample(range(N), self.errors_per_block)
+        ]
+
+    def encrypt(self, m_bits: BitVector, pub: PublicKey) -> BitVector:
+        if len(m_bits) != pub.k:
+            raise ValueError(f"明文长度必须 {pub.k}")
+        # 内部全程以打包整数表示，仅在出入口转换比特列表；
+        # M4R 查表把 k 次行异或降为 k/4 次
+        acc = 0
+        m_int = bits_to_int(m_bits)
+        for tbl in pub.G_pub_m4r:
+            acc ^= tbl[m_int & 15]
+            m_int >>= 4
+        for pos in self._error_positions():
+            acc ^= 1 << pub.P_inv[pos]
+        return int_to_bits(acc, pub.n)
+
+    def decrypt(self, c_bits: BitVector, pub: PublicKey, priv: PrivateKey) -> Tuple[BitVector, bool]:
+        if len(c_bits) != pub.n:
+            raise ValueError(f"密文长度必须 {pub.n}")
+        c_int = bits_to_int(c_bits)
+        # 仅遍历置位：密文第 b 位在私有域落在 P[b] 位
+        c_perm = 0
+        rest = c_int
+        while rest:
+            low = rest & -rest
+            c_perm |= 1 << pub.P[low.bit_length() - 1]
+            rest ^= low
+        decoded = 0
+        success = True
+        mask = (1 << N) - 1
+        for blk in range(pub.L):
+            msg, ok = decode_block_int((c_perm >> (blk * N)) & mask, priv.synd_table)
+            decoded |= msg << (blk * K)
+            success = success and ok
+        acc = 0
+        while decoded:
+            low = decoded & -decoded
+            acc ^= priv.S_inv_rows[low.bit_length() - 1]
+            decoded ^= low
+        return int_to_bits(acc, pub.k), success
+
@@ -1,136 +1,167 @@
-import random
-from typing import List, Sequence, Tuple
-
-BitVector = List[int]
-Matrix = List[List[int]]
-
-
-def bits_to_int(bits: Sequence[int]) -> int:
-    val = 0
-    for i, b in enumerate(bits):
-        if b & 1:
-            val |= 1 << i
-    return val
-
-
-def int_to_bits(value: int, length: int) -> BitVector:
-    return [(value >> i) & 1 for i in range(length)]
-
-
-def parity(x: int) -> int:
-    return bin(x).count("1") & 1
-
-
-def mat_identity(n: int) -> Matrix:
-    return [int_to_bits(1 << i, n) for i in range(n)]
-
-
-def mat_inv(mat: Matrix) -> Matrix:
-    n = len(mat)
-    assert all(len(row) == n for row in mat), "矩阵必须为方阵"
-    A = [row[:] for row in mat]
-    I = mat_identity(n)
-    for col in range(n):
-        pivot = None
-        for r in range(col, n):
-            if A[r][col]:
-                pivot = r
-                break
-        if pivot is None:
-            raise ValueError("矩阵不可逆")
-        if pivot != col:
-            A[col], A[pivot] = A[pivot], A[col]
-            I[col], I[pivot] = I[pivot], I[col]
-        for r in range(n):
-            if r != col and A[r][col]:
-                for c in range(n):
-                    A[r][c] ^= A[col][c]
-                    I[r][c] ^= I[col][c]
-    return I
-
-
-def mat_mul(A: Matrix, B: Matrix) -> Matrix:
-    k, m = len(A), len(A[0])
-    assert len(B) == m
-    n = len(B[0])
-    res = [[0] * n for _ in range(k)]
-    # 预计算 B 列向量
-    cols = []
-    for j in range(n):
-        col_mask = 0
-        for i in range(m):
-            if B[i][j]:
-                col_mask |= 1 << i
-        cols.append(col_mask)
-    for r in range(k):
-        row_mask = bits_to_int(A[r])
-        for c in range(n):
-            res[r][c] = parity(row_mask & cols[c])
-    return res
-
-
-def mat_vec_mul(vec: BitVector, mat: Matrix) -> BitVector:
-    assert len(vec) == len(mat)
-    n = len(mat[0])
-    res = [0] * n
-    cols = []
-    for j in range(n):
-        col_mask = 0
-        for i in range(len(vec)):
-            if mat[i][j]:
-                col_mask |= 1 << i
-        cols.append(col_mask)
-    row_mask = bits_to_int(vec)
-    for j in range(n):
-        res[j] = parity(row_mask & cols[j])
-    return res
-
-
-def random_invertible_matrix(size: int) -> Matrix:
-    while True:
-        mat = [[random.randint(0, 1) for _ in range(size)] for _ in range(size)]
-        try:
-            _ = mat_inv(mat)
-            return mat
-        except ValueError:
-            continue
-
-
-def random_permutation(n: int) -> List[int]:
-    perm = list(range(n))
-    random.shuffle(perm)
-    return perm
-
-
-def apply_permutation(vec: BitVector, perm: Sequence[int]) -> BitVector:
-    return [vec[perm[i]] for i in range(len(perm))]
-
-
-def apply_permutation_matrix(mat: Matrix, perm: Sequence[int]) -> Matrix:
-    return [[row[j] for j in perm] for row in mat]
-
-
-def pack_bits(bits: Sequence[int]) -> bytes:
-    out = bytearray()
-    for i in range(0, len(bits), 8):
-        byte = 0
-        for j in range(8):
-            if i + j < len(bits) and bits[i + j]:
-                byte |= 1 << j
-        out.append(byte)
-    return bytes(out)
-
-
-def unpack_bits(data: bytes, length: int) -> BitVector:
-    bits: BitVector = []
-    for byte in data:
-        for j in range(8):
-            bits.append((byte >> j) & 1)
-            if len(bits) == length:
-                return bits
-    return bits[:length]
-
-
-def weight(vec: Sequence[int]) -> int:
-    return sum(1 for b in vec if b)
-
+import random
+from operator import itemgetter
+from typing import List, Sequence, Tuple
+
+BitVector = List[int]
+Matrix = List[List[int]]
+
+
+def bits_to_int(bits: Sequence[int]) -> int:
+    # 经二进制字符串解析在 C 层完成打包，避免逐位移位（对大整数为 O(n^2)）
+    if not bits:
+        return 0
+    return int(bytes((b & 1) | 0x30 for b in reversed(bits)).decode(), 2)
+
+
+def int_to_bits(value: int, length: int) -> BitVector:
+    if length <= 0:
+        return []
+    s = format(value & ((1 << length) - 1), "b")[::-1]
+    return [1 if c == "1" else 0 for c in s] + [0] * (length - len(s))
+
+
+def parity(x: int) -> int:
+    return x.bit_count() & 1
+
+
+def mat_identity(n: int) -> Matrix:
+    return [int_to_bits(1 << i, n) for i in range(n)]
+
+
+def mat_inv(mat: Matrix) -> Matrix:
+    n = len(mat)
+    assert all(len(row) == n for row in mat), "矩阵必须为方阵"
+    # 每行打包为 [A | I] 的 2n 位整数，高斯消元的行操作变成整行异或
+    rows = [bits_to_int(row) | (1 << (n + i)) for i, row in enumerate(mat)]
+    for col in range(n):
+        pivot = None
+        for r in range(col, n):
+            if (rows[r] >> col) & 1:
+                pivot = r
+                break
+        if pivot is None:
+            raise ValueError("矩阵不可逆")
+        if pivot != col:
+            rows[col], rows[pivot] = rows[pivot], rows[col]
+        pivot_row = rows[col]
+        for r in range(n):
+            if r != col and (rows[r] >> col) & 1:
+                rows[r] ^= pivot_row
+    return [int_to_bits(row >> n, n) for row in rows]
+
+
+def mat_from_bits(mat: Matrix) -> List[int]:
+    """每行打包为一个整数（第 j 列对应第 j 位）"""
+    return [bits_to_int(row) for row in mat]
+
+
+def mat_to_bits(rows: Sequence[int], width: int) -> Matrix:
+    """mat_from_bits 的逆操作"""
+    return [int_to_bits(row, width) for row in rows]
+
+
+def mat_mul(A: Matrix, B: Matrix) -> Matrix:
+    m = len(A[0])
+    assert len(B) == m
+    n = len(B[0])
+    # 行打包为整数后，按 A 行中置位的下标异或累加 B 的整行
+    B_rows = mat_from_bits(B)
+    res_rows = []
+    for row in A:
+        acc = 0
+        for i, b in enumerate(row):
+            if b:
+                acc ^= B_rows[i]
+        res_rows.append(acc)
+    return mat_to_bits(res_rows, n)
+
+
+def mat_vec_mul(vec: BitVector, mat: Matrix) -> BitVector:
+    assert len(vec) == len(mat)
+    n = len(mat[0])
+    acc = 0
+    for i, b in enumerate(vec):
+        if b:
+            acc ^= bits_to_int(mat[i])
+    return int_to_bits(acc, n)
+
+
+def m4r_tables(rows: Sequence[int], chunk: int = 4) -> List[List[int]]:
+    """四俄罗斯人法（M4R）预计算表：每 chunk 行的全部 2^chunk 个异或组合
+
+    向量×矩阵由每行一次异或降为每 chunk 行一次查表。
+    """
+    tables = []
+    for base in range(0, len(rows), chunk):
+        combos = [0]
+        for r in rows[base:base + chunk]:
+            combos += [c ^ r for c in combos]
+        tables.append(combos)
+    return tables
+
+
+def random_invertible_matrix(size: int, rng=random) -> Matrix:
+    # 单位下三角与单位上三角矩阵的乘积必然可逆，免去"采样-求逆-重试"循环
+    lower = [
+        [1 if c == r else (rng.randint(0, 1) if c < r else 0) for c in range(size)]
+        for r in range(size)
+    ]
+    upper = [
+        [1 if c == r else (rng.randint(0, 1) if c > r else 0) for c in range(size)]
+        for r in range(size)
+    ]
+    return mat_mul(lower, upper)
+
+
+def random_permutation(n: int, rng=random) -> List[int]:
+    perm = list(range(n))
+    rng.shuffle(perm)
+    return perm
+
+
+def inverse_permutation(perm: Sequence[int]) -> List[int]:
+    inv = [0] * len(perm)
+    for i, p in enumerate(perm):
+        inv[p] = i
+    return inv
+
+
+def apply_permutation(vec: BitVector, perm: Sequence[int]) -> BitVector:
+    # itemgetter 只接受 ≥1 个下标且单下标时返回标量，长度 ≤1 走通用路径
+    if len(perm) < 2:
+        return [vec[p] for p in perm]
+    return list(itemgetter(*perm)(vec))
+
+
+def apply_permutation_matrix(mat: Matrix, perm: Sequence[int]) -> Matrix:
+    # itemgetter 在 C 层一次取出整行的重排结果；长度 ≤1 同上走通用路径
+    if len(perm) < 2:
+        return [[row[p] for p in perm] for row in mat]
+    getter = itemgetter(*perm)
+    return [list(getter(row)) for row in mat]
+
+
+def pack_bits(bits: Sequence[int]) -> bytes:
+    out = bytearray()
+    for i in range(0, len(bits), 8):
+        byte = 0
+        for j in range(8):
+            if i + j < len(bits) and bits[i + j]:
+                byte |= 1 << j
+        out.append(byte)
+    return bytes(out)
+
+
+def unpack_bits(data: bytes, length: int) -> BitVector:
+    bits: BitVector = []
+    for byte in data:
+        for j in range(8):
+            bits.append((byte >> j) & 1)
+            if len(bits) == length:
+                return bits
+    return bits[:length]
+
+
+def weight(vec: Sequence[int]) -> int:
+    return sum(1 for b in vec if b)
+
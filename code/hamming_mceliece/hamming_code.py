@@ -1,157 +1,192 @@
-import random
-from dataclasses import dataclass
-from typing import List, Tuple
-
-from code.gf2 import (
-    BitVector,
-    Matrix,
-    apply_permutation,
-    apply_permutation_matrix,
-    mat_inv,
-    mat_mul,
-    mat_vec_mul,
-    pack_bits,
-    random_invertible_matrix,
-    random_permutation,
-    weight,
-)
-
-# (15,11) Hamming 单块参数
-PARITY_POS = [1, 2, 4, 8]
-DATA_POS = [i for i in range(1, 16) if i not in PARITY_POS]
-
-
-def encode_block(msg11: BitVector) -> BitVector:
-    if len(msg11) != 11:
-        raise ValueError("消息块必须 11 比特")
-    code = [0] * 16  # 1-indexed
-    for bit, pos in zip(msg11, DATA_POS):
-        code[pos] = bit & 1
-    p1 = sum(code[i] for i in range(1, 16) if i & 1) & 1
-    p2 = sum(code[i] for i in range(1, 16) if i & 2) & 1
-    p4 = sum(code[i] for i in range(1, 16) if i & 4) & 1
-    p8 = sum(code[i] for i in range(1, 16) if i & 8) & 1
-    code[1], code[2], code[4], code[8] = p1, p2, p4, p8
-    return [code[i] for i in range(1, 16)]
-
-
-def syndrome_decode_block(code15: BitVector) -> Tuple[BitVector, bool]:
-    if len(code15) != 15:
-        raise ValueError("码长必须 15 比特")
-    code = [0] + code15[:]
-    s1 = sum(code[i] for i in range(1, 16) if i & 1) & 1
-    s2 = sum(code[i] for i in range(1, 16) if i & 2) & 1
-    s4 = sum(code[i] for i in range(1, 16) if i & 4) & 1
-    s8 = sum(code[i] for i in range(1, 16) if i & 8) & 1
-    syn = s1 | (s2 << 1) | (s4 << 2) | (s8 << 3)
-    corrected = False
-    if syn and 1 <= syn <= 15:
-        code[syn] ^= 1
-        corrected = True
-    msg = [code[pos] for pos in DATA_POS]
-    return msg, corrected
-
-
-def base_generator() -> Matrix:
-    rows: Matrix = []
-    for i in range(11):
-        msg = [1 if j == i else 0 for j in range(11)]
-        rows.append(encode_block(msg))
-    return rows
-
-
-def block_generator(L: int) -> Matrix:
-    base = base_generator()
-    k, n = 11 * L, 15 * L
-    G = [[0] * n for _ in range(k)]
-    for blk in range(L):
-        for r in range(11):
-            row_idx = blk * 11 + r
-            for c, v in enumerate(base[r]):
-                G[row_idx][blk * 15 + c] = v
-    return G
-
-
-@dataclass
-class PublicKey:
-    G_pub: Matrix
-    n: int
-    k: int
-    L: int
-    errors_per_block: int
-    P: List[int]
-
-    def serialize_size(self) -> int:
-        size_G = len(pack_bits([b for row in self.G_pub for b in row]))
-        size_P = len(self.P) * 2
-        return size_G + size_P
-
-
-@dataclass
-class PrivateKey:
-    S_inv: Matrix
-    P_inv: List[int]
-    L: int
-    errors_per_block: int
-
-    def serialize_size(self) -> int:
-        size_S = len(pack_bits([b for row in self.S_inv for b in row]))
-        size_P = len(self.P_inv) * 2
-        return size_S + size_P
-
-
-class HammingMcEliece:
-    def __init__(self, L: int, errors_per_block: int = 1, rng=random):
-        if errors_per_block > 1:
-            raise ValueError("Hamming(15,11) 仅能纠正 1 比特错误")
-        self.L = L
-        self.errors_per_block = errors_per_block
-        self.n = 15 * L
-        self.k = 11 * L
-        self.rng = rng
-        self._G = block_generator(L)
-
-    def keygen(self) -> Tuple[PublicKey, PrivateKey]:
-        S = random_invertible_matrix(self.k)
-        S_inv = mat_inv(S)
-        P = random_permutation(self.n)
-        P_inv = [0] * self.n
-        for i, p in enumerate(P):
-            P_inv[p] = i
-        G_pub = apply_permutation_matrix(mat_mul(S, self._G), P)
-        return (
-            PublicKey(G_pub, self.n, self.k, self.L, self.errors_per_block, P),
-            PrivateKey(S_inv, P_inv, self.L, self.errors_per_block),
-        )
-
-    def _sample_error_private(self) -> BitVector:
-        e = [0] * self.n
-        for blk in range(self.L):
-            positions = list(range(blk * 15, (blk + 1) * 15))
-            self.rng.shuffle(positions)
-            for pos in positions[: self.errors_per_block]:
-                e[pos] = 1
-        return e
-
-    def encrypt(self, m_bits: BitVector, pub: PublicKey) -> BitVector:
-        if len(m_bits) != pub.k:
-            raise ValueError(f"明文长度必须 {pub.k}")
-        u = mat_vec_mul(m_bits, pub.G_pub)
-        e_private = self._sample_error_private()
-        e_public = apply_permutation(e_private, pub.P)
-        return [(u[i] ^ e_public[i]) for i in range(pub.n)]
-
-    def decrypt(self, c_bits: BitVector, pub: PublicKey, priv: PrivateKey) -> Tuple[BitVector, bool]:
-        if len(c_bits) != pub.n:
-            raise ValueError(f"密文长度必须 {pub.n}")
-        c_perm = apply_permutation(c_bits, priv.P_inv)
-        decoded: BitVector = []
-        success = True
-        for blk in range(pub.L):
-            block = c_perm[blk * 15 : (blk + 1) * 15]
-            msg, ok = syndrome_decode_block(block)
-            decoded.extend(msg)
-            success = success and ok
-        m = mat_vec_mul(decoded, priv.S_inv)
-        return m, success
-
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple
+
+from code.gf2 import (
+    BitVector,
+    Matrix,
+    apply_permutation_matrix,
+    bits_to_int,
+    int_to_bits,
+    inverse_permutation,
+    mat_from_bits,
+    mat_inv,
+    mat_mul,
+    m4r_tables,
+    random_invertible_matrix,
+    random_permutation,
+    weight,
+)
+
+# (15,11) Hamming 单块参数
+PARITY_POS = [1, 2, 4, 8]
+DATA_POS = [i for i in range(1, 16) if i not in PARITY_POS]
+
+
+def _encode_int(m_int: int) -> int:
+    code = [0] * 16  # 1-indexed
+    for bit_idx, pos in enumerate(DATA_POS):
+        code[pos] = (m_int >> bit_idx) & 1
+    p1 = sum(code[i] for i in range(1, 16) if i & 1) & 1
+    p2 = sum(code[i] for i in range(1, 16) if i & 2) & 1
+    p4 = sum(code[i] for i in range(1, 16) if i & 4) & 1
+    p8 = sum(code[i] for i in range(1, 16) if i & 8) & 1
+    code[1], code[2], code[4], code[8] = p1, p2, p4, p8
+    return sum(code[i] << (i - 1) for i in range(1, 16))
+
+
+# 全部 2^11 个消息块的码字查找表（消息整数 -> 15 位码字整数）
+CODEBOOK = [_encode_int(m) for m in range(1 << 11)]
+
+
+def encode_block(msg11: BitVector) -> BitVector:
+    if len(msg11) != 11:
+        raise ValueError("消息块必须 11 比特")
+    return int_to_bits(CODEBOOK[bits_to_int(msg11)], 15)
+
+
+def _build_decode_table() -> List[int]:
+    # Hamming(15,11) 是完备码：每个 15 位字距离唯一码字至多 1，
+    # 枚举码字及其单比特翻转即覆盖全部 2^15 个输入
+    table = [0] * (1 << 15)
+    for m_int, cw in enumerate(CODEBOOK):
+        table[cw] = m_int << 1
+        for i in range(15):
+            table[cw ^ (1 << i)] = (m_int << 1) | 1
+    return table
+
+
+# 码字整数 -> (消息整数 << 1) | 是否纠正过一位
+DECODE = _build_decode_table()
+
+
+def syndrome_decode_block(code15: BitVector) -> Tuple[BitVector, bool]:
+    if len(code15) != 15:
+        raise ValueError("码长必须 15 比特")
+    packed = DECODE[bits_to_int(code15)]
+    return int_to_bits(packed >> 1, 11), bool(packed & 1)
+
+
+@lru_cache(maxsize=1)
+def base_generator() -> Matrix:
+    # 单位消息的码字就是 CODEBOOK 中 2 的幂次项
+    return [int_to_bits(CODEBOOK[1 << i], 15) for i in range(11)]
+
+
+@lru_cache(maxsize=None)
+def block_generator(L: int) -> Matrix:
+    # I_L 与单块生成矩阵的 Kronecker 积：整行由列表拼接一次构造
+    base = base_generator()
+    zeros = [0] * 15
+    return [
+        zeros * blk + row + zeros * (L - blk - 1)
+        for blk in range(L)
+        for row in base
+    ]
+
+
+@dataclass
+class PublicKey:
+    G_pub_rows: List[int]  # 行打包的公开生成矩阵（第 j 列对应第 j 位）
+    n: int
+    k: int
+    L: int
+    errors_per_block: int
+    P: List[int]
+    P_inv: List[int]  # 由 P 导出，加密时定位错误比特的公开域位置
+    G_pub_m4r: List[List[int]]  # 由 G_pub 导出的 M4R 查找表，不计入密钥尺寸
+
+    def serialize_size(self) -> int:
+        size_G = (self.k * self.n + 7) // 8
+        size_P = len(self.P) * 2
+        return size_G + size_P
+
+
+@dataclass
+class PrivateKey:
+    S_inv_rows: List[int]  # 行打包的 S^{-1}，解密时按位异或累加
+    P_inv: List[int]
+    L: int
+    errors_per_block: int
+
+    def serialize_size(self) -> int:
+        k = len(self.S_inv_rows)
+        size_S = (k * k + 7) // 8
+        size_P = len(self.P_inv) * 2
+        return size_S + size_P
+
+
+class HammingMcEliece:
+    def __init__(self, L: int, errors_per_block: int = 1, rng=random):
+        if errors_per_block > 1:
+            raise ValueError("Hamming(15,11) 仅能纠正 1 比特错误")
+        self.L = L
+        self.errors_per_block = errors_per_block
+        self.n = 15 * L
+        self.k = 11 * L
+        self.rng = rng
+        self._G = block_generator(L)
+
+    def keygen(self) -> Tuple[PublicKey, PrivateKey]:
+        S = random_invertible_matrix(self.k, self.rng)
+        S_inv = mat_inv(S)
+        P = random_permutation(self.n, self.rng)
+        P_inv = inverse_permutation(P)
+        G_pub = apply_permutation_matrix(mat_mul(S, self._G), P)
+        G_pub_rows = mat_from_bits(G_pub)
+        return (
+            PublicKey(
+                G_pub_rows, self.n, self.k, self.L, self.errors_per_block,
+                P, P_inv, m4r_tables(G_pub_rows),
+            ),
+            PrivateKey(mat_from_bits(S_inv), P_inv, self.L, self.errors_per_block),
+        )
+
+    def _error_positions(self) -> List[int]:
+        """每块注入 errors_per_block 个错误，返回私有域下标"""
+        return [
+            blk * 15 + pos
+            for blk in range(self.L)
+            for pos in self.rng.sample(range(15), self.errors_per_block)
+        ]
+
+    def encrypt(self, m_bits: BitVector, pub: PublicKey) -> BitVector:
+        if len(m_bits) != pub.k:
+            raise ValueError(f"明文长度必须 {pub.k}")
+        # 内部全程以打包整数表示，仅在出入口转换比特列表；
+        # M4R 查表把 k 次行异或降为 k/4 次
+        acc = 0
+        m_int = bits_to_int(m_bits)
+        for tbl in pub.G_pub_m4r:
+            acc ^= tbl[m_int & 15]
+            m_int >>= 4
+        for pos in self._error_positions():
+            acc ^= 1 << pub.P_inv[pos]
+        return int_to_bits(acc, pub.n)
+
+    def decrypt(self, c_bits: BitVector, pub: PublicKey, priv: PrivateKey) -> Tuple[BitVector, bool]:
+        if len(c_bits) != pub.n:
+            raise ValueError(f"密文长度必须 {pub.n}")
+        c_int = bits_to_int(c_bits)
+        # 仅遍历置位：密文第 b 位在私有域落在 P[b] 位
+        c_perm = 0
+        rest = c_int
+        while rest:
+            low = rest & -rest
+            c_perm |= 1 << pub.P[low.bit_length() - 1]
+            rest ^= low
+        decoded = 0
+        success = True
+        mask15 = (1 << 15) - 1
+        for blk in range(pub.L):
+            packed = DECODE[(c_perm >> (blk * 15)) & mask15]
+            decoded |= (packed >> 1) << (blk * 11)
+            success = success and bool(packed & 1)
+        acc = 0
+        while decoded:
+            low = decoded & -decoded
+            acc ^= priv.S_inv_rows[low.bit_length() - 1]
+            decoded ^= low
+        return int_to_bits(acc, pub.k), success
+
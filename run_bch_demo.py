@@ -1,19 +1,21 @@
-import sys
-import os
-
-sys.path.append(os.path.dirname(__file__))
-from code.bch_mceliece.bch_code import BCHMcEliece  # noqa: E402
-
-
-def main():
-    scheme = BCHMcEliece(L=3, errors_per_block=2)
-    pub, priv = scheme.keygen()
-    msg = [int(os.urandom(1)[0] & 1) for _ in range(pub.k)]
-    c = scheme.encrypt(msg, pub)
-    m2, ok = scheme.decrypt(c, pub, priv)
-    print("BCH demo -> 成功:", ok, "消息一致:", msg == m2)
-
-
-if __name__ == "__main__":
-    main()
-
+import sys
+import os
+
+sys.path.append(os.path.dirname(__file__))
+from code.gf2 import int_to_bits  # noqa: E402
+from code.bch_mceliece.bch_code import BCHMcEliece  # noqa: E402
+
+
+def main():
+    scheme = BCHMcEliece(L=3, errors_per_block=2)
+    pub, priv = scheme.keygen()
+    # 一次取足随机字节，避免逐比特调用 os.urandom
+    msg = int_to_bits(int.from_bytes(os.urandom((pub.k + 7) // 8), "little"), pub.k)
+    c = scheme.encrypt(msg, pub)
+    m2, ok = scheme.decrypt(c, pub, priv)
+    print("BCH demo -> 成功:", ok, "消息一致:", msg == m2)
+
+
+if __name__ == "__main__":
+    main()
+
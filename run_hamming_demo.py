@@ -1,20 +1,22 @@
-import sys
-import os
-
-# 便于直接运行
-sys.path.append(os.path.dirname(__file__))
-from code.hamming_mceliece.hamming_code import HammingMcEliece  # noqa: E402
-
-
-def main():
-    scheme = HammingMcEliece(L=3, errors_per_block=1)
-    pub, priv = scheme.keygen()
-    msg = [int(os.urandom(1)[0] & 1) for _ in range(pub.k)]
-    c = scheme.encrypt(msg, pub)
-    m2, ok = scheme.decrypt(c, pub, priv)
-    print("Hamming demo -> 成功:", ok, "消息一致:", msg == m2)
-
-
-if __name__ == "__main__":
-    main()
-
+import sys
+import os
+
+# 便于直接运行
+sys.path.append(os.path.dirname(__file__))
+from code.gf2 import int_to_bits  # noqa: E402
+from code.hamming_mceliece.hamming_code import HammingMcEliece  # noqa: E402
+
+
+def main():
+    scheme = HammingMcEliece(L=3, errors_per_block=1)
+    pub, priv = scheme.keygen()
+    # 一次取足随机字节，避免逐比特调用 os.urandom
+    msg = int_to_bits(int.from_bytes(os.urandom((pub.k + 7) // 8), "little"), pub.k)
+    c = scheme.encrypt(msg, pub)
+    m2, ok = scheme.decrypt(c, pub, priv)
+    print("Hamming demo -> 成功:", ok, "消息一致:", msg == m2)
+
+
+if __name__ == "__main__":
+    main()
+